@@ -182,7 +182,7 @@ def init_dll(dll):
     logger.debug('Critical section - init MagickWand')
     with __lock:
         if not dll.__inited:
-            c_call(None, 'genesis', __init=False)
+            c_call_noinit(None, 'genesis')
 
             logger.debug('Registering atexit handler')
             atexit.register(shutdown)
@@ -237,7 +237,7 @@ from pystacia.util import get_osname, PystaciaException
 from pystacia.compat import formattable, jython
 from pystacia.common import _cleanup
 from pystacia import magick
-from pystacia.api.func import c_call
+from pystacia.api.func import c_call, c_call_noinit
 from pystacia.api.compat import CDLL, find_library as ctypes_find_library
 
 
@@ -966,6 +966,15 @@ data =\
                     'undefined': 0,
                     'uniform_noise': 23,
                     'xor': 12}],
+     'storage': [{'_version': (6, 5, 0),
+                  'char': 1,
+                  'double': 2,
+                  'float': 3,
+                  'integer': 4,
+                  'long': 5,
+                  'quantum': 6,
+                  'short': 7,
+                  'undefined': 0}],
      'type': [{'_version': (6, 5, 0),
                'bilevel': 1,
                'color_separation': 8,
@@ -7,26 +7,44 @@
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
 from threading import Lock
+from operator import attrgetter
 
 from six import b as bytes_, text_type
 
 from pystacia.util import memoized
 from pystacia.compat import pypy
-from pystacia.api.metadata import data as metadata
+from pystacia.api.metadata import data as metadata, names
+
+
+# annotated C functions keyed by (api_type, method), filled on first use
+# so that subsequent calls skip locking in memoized _annote
+_c_methods = {}
+
+
+def get_c_method(api_type, method, throw=True, _cache=_c_methods):
+    resolved = _cache.get((api_type, method))
+    if resolved is None:
+        resolved = _annote(api_type, method, throw)
+        if resolved:
+            _cache[api_type, method] = resolved
+
+    return resolved
 
 
 @memoized
-def get_c_method(api_type, method, throw=True):
+def _annote(api_type, method, throw):
     type_data = metadata[api_type]
-    method_name = type_data['format'](method)
+    method_name = names.get((api_type, method))
+    if method_name is None:
+        # not a known symbol, probing below decides if it exists
+        method_name = type_data['format'](method)
 
     if not throw and not hasattr(get_dll(False), method_name):
         return False
 
     c_method = getattr(get_dll(False), method_name)
 
-    msg = formattable('Annoting {0}')
-    logger.debug(msg.format(method_name))
+    logger.debug('Annoting %s', method_name)
     method_data = type_data['symbols'][method]
 
     argtypes = method_data[0]
@@ -46,75 +64,30 @@ if pypy:
     __lock = Lock()
 
 
-def handle_result(result, restype, args, argtypes):
-    if restype == c_char_p:
-        result = native_str(result)
-    if restype in (c_uint, c_ssize_t, c_size_t):
-        result = int(result)
-    elif restype == enum and not jython:
-        result = result.value
-    elif restype == MagickBoolean and not result:
-        exc_type = ExceptionType()
-
-        if argtypes[0] == MagickWand_p:
-            klass = 'magick'
-        elif argtypes[0] == PixelWand_p:
-            klass = 'pixel'
-
-        description = c_call(klass, 'get_exception', args[0], byref(exc_type))
-        try:
-            raise PystaciaException(native_str(string_at(description)))
-        finally:
-            c_call('magick_', 'relinquish_memory', description)
-
-    return result
-
-
-def prepare_args(c_method, obj, args):
-    keep_ = []
-    args_ = []
-    should_lock = False
-
-    if isinstance(obj, Resource):
-        args = (obj,) + args
-
-    for arg, type in zip(args, c_method.argtypes):  # @ReservedAssignment
-        if type == c_char_p:
-            should_lock = True
-            if isinstance(arg, text_type):
-                arg = bytes_(arg)
-        elif type in (c_size_t, c_ssize_t, c_uint):
-            arg = int(arg)
-        elif type == PixelWand_p and not isinstance(arg, PixelWand_p):
-            arg = color_cast(arg)
-            keep_.append(arg)
-
-        if isinstance(arg, Resource):
-            arg = arg.resource
-
-        args_.append(arg)
+# c_call specifics keyed by (api_type, method): method name, annotated
+# C function, argument converters, whether call should be locked,
+# whether result is a MagickBoolean to check and result handler
+_c_calls = {}
 
-    return keep_, args_, should_lock
 
-
-def c_call(obj, method, *args, **kw):
-    if hasattr(obj.__class__, '_api_type'):
-        api_type = obj.__class__._api_type
-    else:
+def c_call(obj, method, *args):
+    api_type = getattr(obj.__class__, '_api_type', None)
+    if api_type is None:
         api_type = obj
+    else:
+        args = (obj,) + args
 
-    msg = formattable('Translating method {0}.{1}')
-    logger.debug(msg.format(api_type, method))
+    logger.debug('Translating method %s.%s', api_type, method)
 
-    method_name, c_method = get_c_method(api_type, method)
+    spec = _c_calls.get((api_type, method))
+    if spec is None:
+        # every method passes here before its first call so it is
+        # sufficient to ensure MagickWand is initialized only on a miss
+        get_dll()
 
-    try:
-        init = kw.pop('__init')
-    except KeyError:
-        init = True
+        spec = _c_call_spec(api_type, method)
 
-    if init:
-        get_dll()
+    method_name, c_method, converters, should_lock, check, handler = spec
 
     # if objects are casted here and then
     # there is only their resource passed
@@ -122,10 +95,11 @@ def c_call(obj, method, *args, **kw):
     # them and __del__ will be called between
     # driving Imagick to SIGSEGV
     # lets keep references to them
-    keep_, args_, should_lock = prepare_args(c_method, obj, args)
+    keep_ = []
+    args_ = [arg if conv is None else conv(arg, keep_)
+             for conv, arg in zip(converters, args)]
 
-    msg = formattable('Calling {0}')
-    logger.debug(msg.format(method_name))
+    logger.debug('Calling %s', method_name)
 
     if pypy and should_lock:
         __lock.acquire()
@@ -137,16 +111,129 @@ def c_call(obj, method, *args, **kw):
 
     del keep_
 
-    return handle_result(
-        result, c_method.restype, args_, c_method.argtypes)
+    if check and not result:
+        _raise_exception(c_method.argtypes[0], args_[0])
+
+    if handler is not None:
+        result = handler(result)
+
+    return result
+
+
+def c_call_noinit(api_type, method, *args):
+    """Call C method skipping MagickWand initialization.
+
+       Meant only for calls made while MagickWand is being initialized.
+    """
+    if (api_type, method) not in _c_calls:
+        _c_call_spec(api_type, method)
+
+    return c_call(api_type, method, *args)
+
+
+def _c_call_spec(api_type, method):
+    method_name, c_method = get_c_method(api_type, method)
+
+    argtypes, restype = c_method.argtypes, c_method.restype
+    spec = _c_calls[api_type, method] = (
+        method_name, c_method,
+        tuple(_converter(t) for t in argtypes), c_char_p in argtypes,
+        restype == MagickBoolean, _result_handler(restype))
+
+    return spec
 
 
 from pystacia.util import PystaciaException
-from pystacia.compat import native_str, formattable, jython
+from pystacia.compat import native_str, jython
 from pystacia.api import get_dll, logger
 from pystacia.api.type import (
     MagickWand_p, PixelWand_p, MagickBoolean, ExceptionType, enum)
 from pystacia.api.compat import (
-    c_char_p, c_size_t, c_uint, string_at, c_ssize_t, byref)
+    c_char_p, c_size_t, c_uint, string_at, c_ssize_t, c_void_p, byref)
 from pystacia.common import Resource
 from pystacia.color import cast as color_cast
+
+
+# helpers below are defined after the imports above so that the
+# module globals they use can be bound as defaults i.e. fast locals
+
+
+def _result_handler(restype):
+    if restype is c_char_p:
+        return native_str
+    elif restype is c_uint or restype is c_ssize_t or restype is c_size_t:
+        return int
+    elif restype is enum and not jython:
+        return attrgetter('value')
+
+    # result is returned as is
+    return None
+
+
+def _raise_exception(argtype, resource):
+    exc_type = ExceptionType()
+
+    if argtype == MagickWand_p:
+        klass = 'magick'
+    elif argtype == PixelWand_p:
+        klass = 'pixel'
+
+    description = c_call(klass, 'get_exception', resource, byref(exc_type))
+    try:
+        raise PystaciaException(native_str(string_at(description)))
+    finally:
+        c_call('magick_', 'relinquish_memory', description)
+
+
+# encoded text arguments, mostly a small set of formats, options and
+# color names; capped so that e.g. file names do not grow it unbounded
+_bytes_cache = {}
+_bytes_cache_size = 1024
+
+
+def _bytes_arg(arg, keep_, _text_type=text_type, _bytes=bytes_,
+               _cache=_bytes_cache, _size=_bytes_cache_size):
+    if isinstance(arg, _text_type):
+        value = _cache.get(arg)
+        if value is None:
+            value = _bytes(arg)
+            if len(_cache) < _size:
+                _cache[arg] = value
+
+        arg = value
+
+    return arg
+
+
+def _int_arg(arg, keep_):
+    return int(arg)
+
+
+def _resource_arg(arg, keep_, _Resource=Resource):
+    if isinstance(arg, _Resource):
+        arg = arg.resource
+
+    return arg
+
+
+def _color_arg(arg, keep_, _PixelWand_p=PixelWand_p, _cast=color_cast):
+    if not isinstance(arg, _PixelWand_p):
+        arg = _cast(arg)
+        keep_.append(arg)
+        arg = arg.resource
+
+    return arg
+
+
+def _converter(type):  # @ReservedAssignment
+    if type == c_char_p:
+        return _bytes_arg
+    elif type in (c_size_t, c_ssize_t, c_uint):
+        return _int_arg
+    elif type == PixelWand_p:
+        return _color_arg
+    elif type in (MagickWand_p, c_void_p):
+        return _resource_arg
+
+    # value is passed to ctypes as is
+    return None
@@ -128,6 +128,7 @@ data = {
             ('set', 'colorspace'): ((e,), b),
             ('get', 'pixel_color'): ((ss, ss, pw),
                                      b),
+            ('export', 'pixels'): ((ss, ss, s, s, ch, e, v), b),
             ('set', 'background_color'): ((pw,), b),
             ('get', 'background_color'): ((pw,), b),
             ('transform', 'colorspace'): ((e,), b),
@@ -220,3 +221,10 @@ data = {
         }
     }
 }
+
+
+# C function names of all symbols keyed by (api_type, method), computed
+# once here rather than formatted again on each lookup
+names = dict(((api_type, method), type_data['format'](method))
+             for api_type, type_data in data.items()
+             for method in type_data['symbols'])
@@ -162,6 +162,8 @@ class Color(Resource):
 
     """Object representing color information."""
 
+    __slots__ = ()
+
     _api_type = 'pixel'
 
     def _alloc(self):
@@ -201,7 +203,7 @@ class Color(Resource):
            Returns tuple containing red, green and blue channel information
            as numbers between 0 and 1.
         """
-        return (self.r, self.g, self.b)
+        return impl.get_rgb(self)
 
     def get_rgb8(self):
         """Return red, gren and blue components as 8bit integers
@@ -240,7 +242,7 @@ class Color(Resource):
            Returns tuple containing red, green, blue and alpha channel
            information as numbers between 0 and 1.
         """
-        return self.get_rgb() + (self.a,)
+        return impl.get_rgba(self)
 
     def set_rgb(self, r, g, b):
         """Set red, green and blue components all at once.
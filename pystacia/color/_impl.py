@@ -9,6 +9,7 @@
 from pystacia.util import PystaciaException
 from six import reraise
 from sys import exc_info
+from threading import local
 
 
 def alloc():
@@ -67,12 +68,33 @@ def set_alpha(color, value):
     c_call(color, 'set_alpha', value)
 
 
+def get_rgb(color):
+    return tuple(saturate(c_call(color, name)) for name in _rgb_getters)
+
+
+def get_rgba(color):
+    return get_rgb(color) + (get_alpha(color),)
+
+
+_rgb_getters = 'get_red', 'get_green', 'get_blue'
+
+
+# per thread output doubles for get_hsl, reused between calls together
+# with their byref handles instead of allocating three of each every time
+_hsl = local()
+
+
 def get_hsl(color):
-    h, s, l = tuple(x() for x in (c_double,) * 3)
+    try:
+        values, refs = _hsl.scratch
+    except AttributeError:
+        values = tuple(c_double() for _ in range(3))
+        refs = tuple(byref(x) for x in values)
+        _hsl.scratch = values, refs
 
-    c_call(color, 'get_hsl', byref(h), byref(s), byref(l))
+    c_call(color, 'get_hsl', *refs)
 
-    return tuple(saturate(x.value) for x in (h, s, l))
+    return tuple(saturate(x.value) for x in values)
 
 
 def set_hsl(color, hue, saturation, lightness):
@@ -0,0 +1,51 @@
+# coding: utf-8
+
+# pystacia/color/pool.py
+# Copyright (C) 2011-2012 by Paweł Piotr Przeradowski
+
+# This module is part of Pystacia and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+from threading import local
+
+
+"""Thread local pool of reusable scratch colors."""
+
+
+_pool = local()
+
+size = 16
+"""Maximum number of colors kept per thread."""
+
+
+def acquire():
+    """Get scratch :class:`pystacia.color.Color` from the pool.
+
+       Color is either taken from the pool of current thread or newly
+       allocated. Its value is undefined so it needs to be set or read into
+       before use. Hand it back with :func:`release` when done.
+    """
+    stack = getattr(_pool, 'stack', None)
+    if stack:
+        return stack.pop()
+
+    return Color()
+
+
+def release(color):
+    """Return color obtained with :func:`acquire` back to the pool.
+
+       Color must not be used by the caller afterwards.
+    """
+    try:
+        stack = _pool.stack
+    except AttributeError:
+        stack = _pool.stack = []
+
+    if len(stack) < size:
+        stack.append(color)
+    else:
+        color.close()
+
+
+from pystacia.color import Color
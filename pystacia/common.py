@@ -69,6 +69,10 @@ class Resource(object):
        conform to the interface.
     """
 
+    # instances carry only the C handle, weak references are needed
+    # for tracking in _registry
+    __slots__ = ('__resource', '__weakref__')
+
     def __init__(self, resource=None):
         """Construct new instance of resource."""
         self.__resource = resource if resource is not None else self._alloc()
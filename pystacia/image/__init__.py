@@ -9,10 +9,20 @@
 from __future__ import division
 
 from tempfile import mkstemp
-from os import environ
-from os.path import exists
+from os import environ, stat, open as os_open, close as os_close, O_RDONLY
+from stat import S_ISREG
 
-from six import callable as callable_
+from six import callable as callable_, b
+
+try:
+    from io import RawIOBase
+except ImportError:
+    RawIOBase = ()
+
+try:
+    from os import posix_fadvise, POSIX_FADV_WILLNEED, O_NONBLOCK
+except ImportError:
+    posix_fadvise = None
 
 """:class:`Image` creation and management operations"""
 
@@ -40,13 +50,43 @@ def read(filename, factory=None):
        >>> read('example.jpg')
        <Image(w=512,h=512,8bit,rgb,truecolor) object at 0x10302ee00L>
     """
-    if not exists(filename):
+    if not _probe(filename):
         template = formattable('No such file or directory: {0}')
         raise IOError((2, template.format(filename)))
 
     return io.read(filename, factory=factory)
 
 
+def _probe(filename):
+    # same check as os.path.exists, any failure to stat reads as missing
+    try:
+        mode = stat(filename).st_mode
+    except (OSError, ValueError):
+        return False
+
+    # opening FIFOs or devices could block or disturb their writers
+    if posix_fadvise and S_ISREG(mode):
+        _prefetch(filename)
+
+    return True
+
+
+def _prefetch(filename):
+    # start kernel readahead of the whole file into page cache so disk
+    # I/O overlaps with decoding once ImageMagick opens the file itself
+    try:
+        fd = os_open(filename, O_RDONLY | O_NONBLOCK)
+    except OSError:
+        return
+
+    try:
+        posix_fadvise(fd, 0, 0, POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os_close(fd)
+
+
 def read_blob(blob, format=None,  # @ReservedAssignment
               length=None, factory=None):
     """Read :class:`Image` from a blob string or stream with a header.
@@ -78,11 +118,29 @@ def read_blob(blob, format=None,  # @ReservedAssignment
        <Image(w=512,h=512,8bit,rgb,truecolor) object at 0x10302ee00L>
     """
     if hasattr(blob, 'read'):
-        blob = blob.read(length)
+        blob = _read_stream(blob, length)
 
     return io.read_blob(blob, format, factory)
 
 
+def _read_stream(stream, length):
+    # single read on unbuffered stream can return fewer bytes than
+    # asked for so collect chunks until length is satisfied or EOF
+    if length is None or not isinstance(stream, RawIOBase):
+        return stream.read(length)
+
+    chunks = []
+    while length > 0:
+        chunk = stream.read(length)
+        if not chunk:
+            break
+
+        chunks.append(chunk)
+        length -= len(chunk)
+
+    return b('').join(chunks)
+
+
 def read_raw(raw, format, width, height,  # @ReservedAssignment
              depth, factory=None):
     """Read :class:`Image` from raw string or stream.
@@ -116,6 +174,8 @@ from pystacia.image._impl import alloc, clone, free
 
 
 class Image(Resource):
+    __slots__ = ()
+
     _api_type = 'image'
 
     _alloc = alloc
@@ -216,6 +276,21 @@ class Image(Resource):
                     height=self.height,
                     depth=self.depth)
 
+    def get_array(self, format='RGB', dtype='uint8'):  # @ReservedAssignment
+        """Return pixel data as :term:`numpy` array.
+
+           :param format: channel order such as :term:`RGB` or ``'RGBA'``
+           :type format: ``str``
+           :param dtype: element type, one of ``uint8``, ``uint16``,
+             ``float32`` or ``float64``
+           :rtype: ``numpy.ndarray``
+
+           Exports pixels into a new array of shape ``(height, width,
+           len(format))`` without an intermediate blob. Floating point
+           values are normalized between 0 and 1. Requires :term:`numpy`.
+        """
+        return pixel.get_array(self, format, dtype)
+
     def rescale(self, width=None, height=None,
                 factor=None, filter=None, blur=1):  # @ReservedAssignment
         """Rescales an image to given dimensions.
@@ -955,6 +1030,19 @@ class Image(Resource):
         """
         return pixel.get_pixel(self, x, y, factory)
 
+    def get_pixels(self, coords):
+        """Get colors of many pixels at once.
+
+           :param coords: sequence of ``(x, y)`` coordinates
+           :rtype: ``list``
+
+           Returns list of red, green, blue and alpha tuples, one per point,
+           as returned by :meth:`pystacia.color.Color.get_rgba`. Points
+           close to each other are read with a single call which makes it
+           much faster than calling :meth:`get_pixel` repeatedly.
+        """
+        return pixel.get_pixels(self, coords)
+
     def fill(self, fill, blend=1):
         """Overlay color over whole image.
 
@@ -1152,7 +1240,7 @@ class Image(Resource):
 
            Return image width in pixels.
         """
-        return self._get_state('width')
+        return c_call(self, ('get', 'width'))
 
     @property
     def height(self):
@@ -1162,7 +1250,7 @@ class Image(Resource):
 
            Return image height in pixels.
         """
-        return self._get_state('height')
+        return c_call(self, ('get', 'height'))
 
     @property
     def format(self):  # @ReservedAssignment
@@ -1187,7 +1275,8 @@ class Image(Resource):
            >> img.size
            (640, 480)
         """
-        return (self.width, self.height)
+        return (c_call(self, ('get', 'width')),
+                c_call(self, ('get', 'height')))
 
     def __depth():  # @NoSelf
         doc = (# NOQA
@@ -1233,12 +1322,17 @@ class Image(Resource):
         if checkerboard:
             image.checkerboard()
 
-        if zoom:
+        # rescaling by 1 would still resample every pixel
+        if zoom and zoom != 1:
             image.rescale(factor=zoom, filter='point')
 
-        tmpname = mkstemp()[1] + '.' + extension
+        fd, tmpname = mkstemp(suffix='.' + extension)
+        os_close(fd)
 
         image.write(tmpname)
+        if image is not self:
+            image.close()
+
         if not no_gui:
             gui_open('file://' + tmpname)
 
@@ -1320,7 +1414,19 @@ __exclusions = [
     'webbrowser_open',
     'mkstemp',
     'environ',
-    'exists',
+    'stat',
+    'os_open',
+    'os_close',
+    'O_RDONLY',
+    'O_NONBLOCK',
+    'S_ISREG',
+    'posix_fadvise',
+    'POSIX_FADV_WILLNEED',
+    'RawIOBase',
+    'b',
+    '_read_stream',
+    '_prefetch',
+    '_probe',
     'color',
     'color_module',
     'formattable',
@@ -6,6 +6,8 @@
 # This module is part of Pystacia and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
+from pystacia.util import memoized
+
 
 def alloc(image):
     return c_call('wand', 'new')
@@ -19,4 +21,17 @@ def clone(image):
     return c_call('wand', 'clone', image)
 
 
+@memoized
+def transparent():
+    # shared and never modified, saves allocating a color on each use
+    return from_string('transparent')
+
+
+@memoized
+def opaque():
+    # full opacity blend shared the same way as transparent color
+    return from_rgb(1, 1, 1)
+
+
 from pystacia.api.func import c_call
+from pystacia.color import from_string, from_rgb
@@ -12,22 +12,32 @@ def swirl(image, angle):
 
 
 def wave(image, amplitude, length, offset, axis):
-    if not axis:
+    if axis is None:
         axis = axes.x
 
-    transparent = from_string('transparent')
-
     # preserve background color
-    old_color = Color()
+    old_color = pool.acquire()
+    try:
+        c_call(image, ('get', 'background_color'), old_color)
+        c_call(image, ('set', 'background_color'), transparent())
+
+        # wave displaces along y so for the other axis image is transposed
+        # there and back, a plain pixel reorder unlike a pair of rotations
+        transpose = axis == axes.y
+        if transpose:
+            c_call(image, 'transpose')
 
-    c_call(image, ('get', 'background_color'), old_color)
-    c_call(image, ('set', 'background_color'), transparent)
+        c_call(image, 'wave', amplitude, length)
 
-    c_call(image, 'wave', amplitude, length)
+        if transpose:
+            c_call(image, 'transpose')
 
-    c_call(image, ('set', 'background_color'), old_color)
+        c_call(image, ('set', 'background_color'), old_color)
+    finally:
+        pool.release(old_color)
 
 
 from pystacia.api.func import c_call
-from pystacia.color import from_string, Color
+from pystacia.image._impl import transparent
+from pystacia.color import pool
 from pystacia.image.enum import axes
@@ -13,10 +13,11 @@ from math import degrees, atan
 
 def _proportionally(image, width, height):
     if width and not height:
-        height = image.height * width / image.width
-
-    if height and not width:
-        width = image.width * height / image.height
+        image_width, image_height = image.size
+        height = image_height * width / image_width
+    elif height and not width:
+        image_width, image_height = image.size
+        width = image_width * height / image_height
 
     return width, height
 
@@ -33,22 +34,25 @@ def rescale(image, width, height, factor, filter, blur):  # @ReservedAssignment
             raise PystaciaException(msg)
 
         width, height = image.size
-        if not hasattr(factor, '__getitem__'):
-            factor = (factor, factor)
-        width, height = width * factor[0], height * factor[1]
+        try:
+            x_factor, y_factor = factor
+        except TypeError:
+            x_factor = y_factor = factor
+        width, height = width * x_factor, height * y_factor
 
     c_call(image, 'resize', width, height, enum_lookup(filter, filters), blur)
 
 
 def _calculate_mode(image, width, height, mode):
-    ratio = width / image.width
+    image_width, image_height = image.size
+    ratio = width / image_width
 
     if mode == 'in':
-        if image.width * ratio > width or image.height * ratio > height:
-            ratio = height / image.height
+        if image_width * ratio > width or image_height * ratio > height:
+            ratio = height / image_height
     elif mode == 'out':
-        if image.height * ratio < height:
-            ratio = height / image.height
+        if image_height * ratio < height:
+            ratio = height / image_height
 
     return width * ratio, height * ratio
 
@@ -57,7 +61,8 @@ def fit(image, width, height, mode,
         upscale, filter, blur):  # @ReservedAssignment
     width_, height_ = _proportionally(image, width, height)
 
-    smaller = image.width <= width_ and image.height <= height_
+    image_width, image_height = image.size
+    smaller = image_width <= width_ and image_height <= height_
 
     if (smaller and upscale) or not smaller:
         if not width or not height:
@@ -73,8 +78,11 @@ def fit(image, width, height, mode,
 
         rescale(image, width, height, None, filter, blur)
 
-    x, y = ((background.width - image.width) / 2,
-            (background.height - image.height) / 2)
+    # image might have been rescaled above so its size is read again
+    background_width, background_height = background.size
+    image_width, image_height = image.size
+    x, y = ((background_width - image_width) / 2,
+            (background_height - image_height) / 2)
     background.overlay(image, x, y)
 
     image._replace(background)
@@ -85,17 +93,16 @@ def resize(image, width, height, x, y):
 
 
 def rotate(image, angle):
-    c_call(image, 'rotate', from_string('transparent'), angle)
+    c_call(image, 'rotate', transparent(), angle)
 
 
 def flip(image, axis):
-    if axis.name == 'x':
-        c_call(image, 'flip')
-    elif axis.name == 'y':
-        c_call(image, 'flop')
-    else:
+    method = flip_methods.get(axis)
+    if not method:
         raise PystaciaException('axis must be X or Y')
 
+    c_call(image, method)
+
 
 def transpose(image):
     c_call(image, 'transpose')
@@ -106,16 +113,16 @@ def transverse(image):
 
 
 def skew(image, offset, axis):
-    if not axis:
-        axis = axes.x
+    if axis is None:
+        axis = x_axis
 
-    if axis == axes.x:
+    if axis == x_axis:
         x_angle = degrees(atan(offset / image.height))
         y_angle = 0
-    elif axis == axes.y:
+    elif axis == y_axis:
         x_angle = 0
         y_angle = degrees(atan(offset / image.width))
-    c_call(image, 'shear', from_string('transparent'), x_angle, y_angle)
+    c_call(image, 'shear', transparent(), x_angle, y_angle)
 
 
 def roll(image, x, y):
@@ -129,31 +136,33 @@ def straighten(image, threshold):
 def trim(image, similarity, background):
     # TODO: guessing of background?
     if not background:
-        background = from_string('transparent')
+        background = transparent()
 
     # preserve background color
-    old_color = Color()
+    old_color = pool.acquire()
+    try:
+        c_call(image, ('get', 'background_color'), old_color)
+        c_call(image, ('set', 'background_color'), background)
 
-    c_call(image, ('get', 'background_color'), old_color)
-    c_call(image, ('set', 'background_color'), background)
+        c_call(image, 'trim', similarity * 000)
 
-    c_call(image, 'trim', similarity * 000)
-
-    c_call(image, ('set', 'background_color'), old_color)
+        c_call(image, ('set', 'background_color'), old_color)
+    finally:
+        pool.release(old_color)
 
 
 def splice(image, x, y, width, height):
-    background = from_string('transparent')
-
     # preserve background color
-    old_color = Color()
+    old_color = pool.acquire()
+    try:
+        c_call(image, ('get', 'background_color'), old_color)
+        c_call(image, ('set', 'background_color'), transparent())
 
-    c_call(image, ('get', 'background_color'), old_color)
-    c_call(image, ('set', 'background_color'), background)
+        c_call(image, 'splice', width, height, x, y)
 
-    c_call(image, 'splice', width, height, x, y)
-
-    c_call(image, ('set', 'background_color'), old_color)
+        c_call(image, ('set', 'background_color'), old_color)
+    finally:
+        pool.release(old_color)
 
 
 def chop(image, x, y, width, height):
@@ -164,4 +173,11 @@ from pystacia.util import PystaciaException
 from pystacia.api.enum import lookup as enum_lookup
 from pystacia.image.generic import blank
 from pystacia.api.func import c_call
-from pystacia.color import from_string, Color
+from pystacia.image._impl import transparent
+from pystacia.color import pool
+
+# resolved once instead of going through lazy enum on every call
+x_axis, y_axis = axes.x, axes.y
+
+# C method flipping along axis given either as enum value or its name
+flip_methods = {x_axis: 'flip', y_axis: 'flop', 'x': 'flip', 'y': 'flop'}
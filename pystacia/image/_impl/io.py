@@ -90,7 +90,11 @@ def get_blob(image, format, compression,  # @ReservedAssignment
     with state(image, compression=compression, compression_quality=quality):
         format = format.upper()  # @ReservedAssignment
         old_format = c_call('magick', 'get_format', image)
-        c_call('magick', 'set_format', image, format)
+        # encoding to the format wand is already set to is common, there
+        # is nothing to set nor restore then
+        switch = old_format != format
+        if switch:
+            c_call('magick', 'set_format', image, format)
 
         size = c_size_t()
         result = c_call(image, ('get', 'blob'), byref(size))
@@ -101,7 +105,8 @@ def get_blob(image, format, compression,  # @ReservedAssignment
 
         c_call('magick_', 'relinquish_memory', result)
 
-        c_call('magick', 'set_format', image, old_format)
+        if switch:
+            c_call('magick', 'set_format', image, old_format)
 
         return blob
 
@@ -15,14 +15,101 @@ def get_pixel(self, x, y, factory):
     return color_
 
 
+def get_pixels(image, coords):
+    coords = [(int(x), int(y)) for x, y in coords]
+    if not coords:
+        return []
+
+    xs = [x for x, _ in coords]
+    ys = [y for _, y in coords]
+    left, top = min(xs), min(ys)
+    width, height = max(xs) - left + 1, max(ys) - top + 1
+
+    # for scattered points most of bounding box would be exported
+    # for nothing, it's cheaper to read them one by one
+    if width * height > len(coords) * _sparse:
+        return [_get_rgba(image, x, y) for x, y in coords]
+
+    # export bounding box of all points at once instead of reading
+    # them one by one with separate C calls
+    # doubles match what Color.get_rgba reads for points read one by one
+    channels = (c_double * (width * height * 4))()
+    c_call(image, ('export', 'pixels'), left, top, width, height,
+           'RGBA', enum_lookup('double', storages), channels)
+
+    result = []
+    for x, y in coords:
+        offset = ((y - top) * width + x - left) * 4
+        result.append(tuple(saturate(v)
+                            for v in channels[offset:offset + 4]))
+
+    return result
+
+
+# bounding box pixels per point above which points are read one by one
+_sparse = 256
+
+
+def _get_rgba(image, x, y):
+    color_ = pool.acquire()
+    try:
+        c_call(image, ('get', 'pixel_color'), x, y, color_)
+
+        return color_.get_rgba()
+    finally:
+        pool.release(color_)
+
+
+# storage types matching numpy dtypes by kind and item size
+_storages = {
+    ('u', 1): 'char',
+    ('u', 2): 'short',
+    ('f', 4): 'float',
+    ('f', 8): 'double'
+}
+
+
+def get_array(image, format, dtype):  # @ReservedAssignment
+    # numpy is optional and imported only when needed
+    import numpy
+
+    dtype = numpy.dtype(dtype)
+    storage = _storages.get((dtype.kind, dtype.itemsize))
+    # pixels are exported in native byte order only
+    if not storage or dtype.byteorder not in ('=', '|'):
+        template = formattable('Unsupported array type: {0}')
+        raise PystaciaException(template.format(dtype))
+
+    width, height = image.size
+    array = numpy.empty((height, width, len(format)), dtype)
+
+    # pixels are exported straight into array memory
+    c_call(image, ('export', 'pixels'), 0, 0, width, height,
+           format.upper(), enum_lookup(storage, storages),
+           array.ctypes.data_as(c_void_p))
+
+    return array
+
+
 def fill(image, fill, blend):
     # image magick ignores alpha setting of color
     # let's incorporate it into blend
     blend *= fill.alpha
 
-    blend = from_rgb(blend, blend, blend)
+    # nothing gets overlaid
+    if blend <= 0:
+        return
+
+    if blend == 1:
+        c_call(image, 'colorize', fill, opaque())
+    else:
+        blend_color = pool.acquire()
+        try:
+            blend_color.set_rgba(blend, blend, blend, 1)
 
-    c_call(image, 'colorize', fill, blend)
+            c_call(image, 'colorize', fill, blend_color)
+        finally:
+            pool.release(blend_color)
 
 
 def set_color(image, fill):
@@ -73,9 +160,13 @@ def compare(image, other, metric, factory):
 
 from pystacia.api.func import get_c_method, c_call
 from pystacia.api.enum import lookup as enum_lookup
-from pystacia.api.compat import c_double, byref
-from pystacia.image.enum import metrics, composites
+from pystacia.api.compat import c_double, c_void_p, byref
+from pystacia.image.enum import metrics, composites, storages
+from pystacia.util import PystaciaException
+from pystacia.compat import formattable
 from pystacia.image import Image
 from pystacia.image.generic import blank
-from pystacia.color import from_rgb
+from pystacia.color import pool
+from pystacia.image._impl import opaque
+from pystacia.color._impl import saturate
 from pystacia import color
@@ -14,6 +14,9 @@ from os.path import dirname, join, exists
 from pystacia.util import memoized
 
 
+_lena_path = join(dirname(dirname(__file__)), 'lena.png')
+
+
 @memoized
 def lena_available():
     """Check if lena test image is available in this install
@@ -45,11 +48,8 @@ def lena(width=None, factory=None):
          defaults to 512x512 which is how the bitmap is stored internally.
 
     """
-    lena_path = join(dirname(pystacia.__file__), 'lena.png')
-    if not exists(lena_path) or 'png' not in magick.get_formats():
-        raise PystaciaException('Not available')
-
-    img = io.read(lena_path, factory)
+    image_factory = registry.get('image_factory', override=factory)
+    img = image_factory(clone(_lena()))
 
     if width:
         img.rescale(width, width)
@@ -57,6 +57,16 @@ def lena(width=None, factory=None):
     return img
 
 
+@memoized
+def _lena():
+    # decoded once and kept as prototype which lena clones, it must
+    # never be modified nor handed out
+    if not exists(_lena_path) or 'png' not in magick.get_formats():
+        raise PystaciaException('Not available')
+
+    return io.read(_lena_path)
+
+
 def magick_logo(factory=None):
     """Return ImageMagick logo image.
 
@@ -97,7 +107,7 @@ def netscape(factory=None):
     """
     return io.read('netscape:', factory=factory)
 
-import pystacia
-from pystacia.image._impl import io
+from pystacia.image._impl import io, clone
+from pystacia import registry
 from pystacia import magick
 from pystacia.util import PystaciaException
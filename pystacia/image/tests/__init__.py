@@ -12,9 +12,15 @@ import sys
 from threading import Thread
 from re import match
 from tempfile import mkstemp
+from io import RawIOBase
 
 from six import b, BytesIO
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from pystacia.image import Image
 from pystacia.tests.common import TestCase, skipIf, expectedFailure
 
@@ -52,6 +58,48 @@ class WithFactory(TestCase):
         img.close()
         img2.close()
 
+    def test_get_pixels(self):
+        img = blank(3, 2, color.from_string('red'))
+
+        self.assertEqual(img.get_pixels([]), [])
+        self.assertEqual(img.get_pixels([(0, 0), (2, 1)]),
+                         [(1, 0, 0, 1), (1, 0, 0, 1)])
+        self.assertEqual(img.get_pixels([(1, 1)]),
+                         [img.get_pixel(1, 1).get_rgba()])
+        self.assertEqual(img.get_pixels([(0.0, 1.0)]), [(1, 0, 0, 1)])
+
+        img.close()
+
+        # scattered points are read one by one
+        img = sample()
+        coords = [(0, 0), (img.width - 1, img.height - 1)]
+
+        self.assertEqual(img.get_pixels(coords),
+                         [img.get_pixel(x, y).get_rgba() for x, y in coords])
+
+        img.close()
+
+    @skipIf(not numpy, 'numpy is not available')
+    def test_get_array(self):
+        img = blank(3, 2, color.from_string('red'))
+
+        array = img.get_array()
+        self.assertEqual(array.shape, (2, 3, 3))
+        self.assertEqual(array.dtype, numpy.uint8)
+        self.assertEqual(tuple(array[1, 2]), (255, 0, 0))
+
+        array = img.get_array('rgba', 'float64')
+        self.assertEqual(array.shape, (2, 3, 4))
+        self.assertEqual(tuple(array[0, 0]), (1, 0, 0, 1))
+
+        self.assertRaises(PystaciaException,
+                          lambda: img.get_array(dtype='int8'))
+        swapped = numpy.dtype('float32').newbyteorder()
+        self.assertRaises(PystaciaException,
+                          lambda: img.get_array(dtype=swapped))
+
+        img.close()
+
     def test_blank(self):
         img = blank(10, 20)
 
@@ -96,6 +144,26 @@ def _test_doesnot_explode(method, args=None, different=True):
     return test
 
 
+class ChunkedStream(RawIOBase):
+    """Unbuffered stream returning at most size bytes per read."""
+
+    def __init__(self, data, size):
+        self.data = data
+        self.size = size
+        self.reads = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        self.reads += 1
+        chunk = self.data[:min(len(target), self.size)]
+        self.data = self.data[len(chunk):]
+        target[:len(chunk)] = chunk
+
+        return len(chunk)
+
+
 class WithSample(TestCase):
     def setUp(self):
         self.img = sample()
@@ -119,6 +187,30 @@ class WithSample(TestCase):
             self.assertTrue(img.colorspace.name.endswith('rgb'))
             self.assertEqual(img.depth, 8)
 
+    def test_read_blob_raw(self):
+        bmp = self.img.get_blob('bmp')
+
+        stream = ChunkedStream(bmp, 1000)
+        img = read_blob(stream, length=len(bmp))
+
+        self.assertGreater(stream.reads, 1)
+        self.assertEqual(img.size, sample_size)
+        self.assertEqual(img.type, sample_type)
+
+        img.close()
+
+    def test_read_stream(self):
+        data = b('abcdefghij')
+
+        stream = ChunkedStream(data, 3)
+        self.assertEqual(_read_stream(stream, 5), data[:5])
+        self.assertEqual(stream.reads, 2)
+
+        # stream ends before length is satisfied
+        stream = ChunkedStream(data, 3)
+        self.assertEqual(_read_stream(stream, 100), data)
+        self.assertEqual(stream.reads, 5)
+
     def test_read(self):
         self.assertRaises(IOError, lambda: read('/non/existant.qwerty'))
 
@@ -267,6 +359,15 @@ class WithSample(TestCase):
         self.assertEqual(img.get_pixel(25, 10).alpha, 0)
         self.assertEqual(img.get_pixel(128, 128).alpha, 1)
 
+        img = sample()
+
+        img.wave(10, 100, axis=axes.y)
+        new_size = (sample_size[0] + 20, sample_size[1])
+        self.assertEqual(img.size, new_size)
+        self.assertEqual(img.get_pixel(10, 25).alpha, 0)
+
+        img.close()
+
     test_fx = _test_doesnot_explode('fx', ['1/2 * u'])
 
     def test_gamma(self):
@@ -540,9 +641,22 @@ class WithSample(TestCase):
         img = self.img
 
         red = color.from_string('red')
+
+        # nothing is overlaid with zero blend or transparent color
+        copy = img.copy()
+        img.fill(red, blend=0)
+        self.assertTrue(img.is_same(copy))
+        img.fill(color.from_rgba(1, 0, 0, 0))
+        self.assertTrue(img.is_same(copy))
+
+        # full blend matches colorize with opaque blend color
+        c_call(copy, 'colorize', red, color.from_rgb(1, 1, 1))
         img.fill(red)
+        self.assertTrue(img.is_same(copy))
         self.assertEqual(img.get_pixel(40, 40), red)
 
+        copy.close()
+
     def test_splice(self):
         img = self.img
 
@@ -652,8 +766,10 @@ class ThreadedTest(TestCase):
 
 
 from pystacia.util import PystaciaException
+from pystacia.api.func import c_call
 from pystacia.image import (
-    read, read_raw, read_blob, types, colorspaces, blank, axes, checkerboard)
+    read, read_raw, read_blob, types, colorspaces, blank, axes, checkerboard,
+    _read_stream)
 from pystacia import color, registry, magick
 from pystacia.tests.common import sample, sample_type, sample_size
 from random import randint
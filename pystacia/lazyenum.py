@@ -40,6 +40,10 @@ class EnumValue(object):
         return repr(self.enum) + '.' + self.name
 
     def __eq__(self, other):
+        # values are singletons so identity settles the common case
+        if other is self:
+            return True
+
         try:
             other = self.enum.cast(other)
         except CastException:
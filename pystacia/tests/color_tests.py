@@ -158,7 +158,21 @@ class ColorTest(TestCase):
         self.assertRaisesRegexp(PystaciaException, 'Unknown color',
                                 lambda: color.from_string('x-wrong-color'))
 
+    def test_pool(self):
+        first = pool.acquire()
+        self.assertIsInstance(first, color.Color)
+
+        pool.release(first)
+        self.assertIs(pool.acquire(), first)
+
+        colors = [pool.acquire() for _ in range(pool.size + 1)]
+        [pool.release(c) for c in colors]
+
+        self.assertTrue(colors[-1].closed)
+        self.assertFalse(colors[0].closed)
+
 from pystacia.color._impl import saturate
 from pystacia import color, registry
+from pystacia.color import pool
 from pystacia.util import PystaciaException
 from pystacia.compat import formattable
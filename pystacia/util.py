@@ -86,8 +86,9 @@ def chainable(f, obj, *args, **kw):
     return obj
 
 
-# memoized cache
+# memoized values and locks of keys being currently computed
 __cache = {}
+__locks = {}
 
 
 @decorator
@@ -99,31 +100,55 @@ def memoized(f, *args, **kw):
     thread-safe.
     """
     key = f, args, frozenset(kw.items())
-    if key not in __cache:
-        with __lock:
-            if key not in __cache:
-                __cache[key] = {'lock': RLock()}
 
-    key_cache = __cache[key]
-    if 'value' not in key_cache:
-        with key_cache['lock']:
-            if 'value' not in key_cache:
-                info = key[0].__name__, key[1]
-                msg = formattable('Memoizing {0} args={1}').format(*info)
-                logger.debug(msg)
+    # values are never removed so a hit needs no locking
+    try:
+        return __cache[key]
+    except KeyError:
+        pass
 
-                result = f(*args, **kw)
+    with __lock:
+        key_lock = __locks.get(key)
+        if key_lock is None:
+            key_lock = __locks[key] = RLock()
 
-                key_cache['value'] = result
-                msg = formattable('Memoized {0} args={1}').format(*info)
-                logger.debug(msg)
+    with key_lock:
+        if key not in __cache:
+            logger.debug('Memoizing %s args=%s', f.__name__, args)
 
-    return key_cache['value']
+            __cache[key] = f(*args, **kw)
+
+            logger.debug('Memoized %s args=%s', f.__name__, args)
+
+        # threads still waiting hold their reference to the lock
+        __locks.pop(key, None)
+
+    return __cache[key]
 
 __lock = Lock()
 
 
-@memoized
+# values of memoized_pure functions
+__pure_cache = {}
+
+
+@decorator
+def memoized_pure(f, *args, **kw):
+    """Decorator that caches return value of a deterministic function.
+
+    Unlike :func:`memoized` it takes no locks at all. Concurrent first calls
+    may evaluate function more than once but all of them return the value
+    stored first. Use only for functions without side effects.
+    """
+    key = f, args, frozenset(kw.items())
+
+    try:
+        return __pure_cache[key]
+    except KeyError:
+        return __pure_cache.setdefault(key, f(*args, **kw))
+
+
+@memoized_pure
 def get_osname():
     if hasattr(platform, 'win32_ver') and platform.win32_ver()[0]:
         return 'windows'
@@ -41,6 +41,7 @@ enums = {
     'noise': ('NoiseType', len('Noise'), split_by_word),
     'operation': ('MagickEvaluateOperator', len('EvaluateOpeartor'),
                   split_by_word),
+    'storage': ('StorageType', len('Pixel'), str.lower),
     'type': ('ImageType', len('Type'), image_type),
 }
 